@@ -7,7 +7,7 @@ plain text to Morse code and vice versa, and generating audio files
 with Morse code based on either Morse code or plain text input.
 """
 
-from morsecode.UI import tk
+from morsecode.UI import main
 
 if __name__ == "__main__":
-    tk.mainloop()
+    main()
@@ -2,25 +2,47 @@
 This module contains all the functions used by the application.
 """
 
-import re
 import os
+import io
+import wave
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import tkinter as tk
 from tkinter import messagebox
-import playsound3
-import unidecode
-import pyperclip
-import pycw
 import morsecode.globals as global_const
 
 # Filepath to the most-recently-generated audio file
 most_recent_audio_filepath: str = ""
 
+# Counter of the most-recently-generated audio file per output directory
+last_audio_file_counters: dict = {}
+
+# Most recently generated audio files, along with their modification
+# times, by output directory, text, and audio settings, from the least
+# to the most recently used
+generated_audio_files: OrderedDict = OrderedDict()
+
+# Worker thread generating the audio files off the Tk event loop
+audio_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+
+# Token of the most recent audio file generation; the outcomes
+# of the earlier ones are discarded
+audio_file_generation: int = 0
+
 
 def play_audio_file(audio_status: str) -> None:
     """Play back the most-recently-generated Morse code audio file.
 
     Args:
-        audio_status: str: Text from the widget entry_audio_status.
+        audio_status: str: Audio status, i.e. the filepath to the
+                           most-recently-generated audio file (which
+                           is empty while no audio file is ready,
+                           including while the next one is being
+                           generated), or text from the widget
+                           entry_audio_status.
 
     Raises:
         PlaysoundException: If the audio file can't be played back.
@@ -36,8 +58,11 @@ def play_audio_file(audio_status: str) -> None:
 
     # Check whether the audio_status is non-empty
     if audio_status:
+        import playsound3  # Deferred to the first playback to speed up startup
+
         try:
-            playsound3.playsound(sound=most_recent_audio_filepath)
+            # Play it back without blocking the Tk event loop
+            playsound3.playsound(sound=most_recent_audio_filepath, block=False)
 
         except playsound3.playsound3.PlaysoundException as e:
             # Display an error if the audio file can't be played
@@ -49,6 +74,22 @@ def play_audio_file(audio_status: str) -> None:
                                message=global_const.MESSAGEBOX_MSG_PLAY_WARNING)
 
 
+def warm_up_imports() -> None:
+    """Import the modules deferred to their first use (unidecode,
+    pycw, playsound3, and pyperclip), so that they're already loaded
+    when the user needs them. The function is meant to be run
+    by the audio worker thread once the GUI has been displayed.
+
+    Returns:
+        None
+    """
+
+    import unidecode  # noqa: F401
+    import pycw  # noqa: F401
+    import playsound3  # noqa: F401
+    import pyperclip  # noqa: F401
+
+
 def change_entry_text(entry_to_change: tk.Entry, change_to: str = "") -> None:
     """Change a displayed entry widget text.
 
@@ -70,6 +111,14 @@ def change_entry_text(entry_to_change: tk.Entry, change_to: str = "") -> None:
                              message=global_const.MESSAGEBOX_MSG_CHANGE_ENTRY_WRONG_SECOND_ARG_ERROR)
         return
 
+    # If the widget is bound to a variable, set the variable instead,
+    # which changes the text regardless of the widget's state.
+    entry_widget_variable = str(entry_to_change.cget("textvariable"))
+
+    if entry_widget_variable:
+        entry_to_change.setvar(name=entry_widget_variable, value=change_to)
+        return
+
     # Get the widget's current state ("readonly"/"normal")
     entry_widget_original_state = entry_to_change.cget("state")
 
@@ -109,12 +158,374 @@ def change_most_recent_filepath(change_to: str = "") -> None:
         most_recent_audio_filepath = change_to
 
 
-def create_audio_file(normalized_text: str, audio_status: tk.Entry) -> None:
+def discard_audio_file() -> int:
+    """Discard the most-recently-generated audio file, and the one
+    being generated, if any, by starting a new audio file generation,
+    so that the outcome of the previous one is never displayed.
+
+    Returns:
+        int: The token of the new audio file generation.
+    """
+
+    global audio_file_generation
+    audio_file_generation += 1
+
+    change_most_recent_filepath()
+
+    return audio_file_generation
+
+
+def build_audio_filepath(counter: int = 0) -> str:
+    """Build the audio filepath in the output directory for a given
+    counter. The counter is appended to the default filename unless
+    it's zero.
+
+    Args:
+        counter: int: Number distinguishing the audio file; defaults to 0.
+
+    Returns:
+        str: The audio filepath.
+    """
+
+    audio_file_name: str = f"{global_const.DEFAULT_AUDIO_OUTPUT_DIR}/{global_const.DEFAULT_AUDIO_OUTPUT_FILE_STEM}"
+
+    if counter:
+        audio_file_name = f"{audio_file_name}_{counter}"
+
+    return f"{audio_file_name}{global_const.DEFAULT_AUDIO_OUTPUT_FILE_EXT}"
+
+
+def find_last_audio_file_counter() -> int:
+    """Find the highest counter among the audio files in the output
+    directory with a single directory scan.
+
+    Returns:
+        int: The highest counter, or -1 if there are no audio files.
+    """
+
+    last_counter: int = -1
+
+    try:
+        with os.scandir(global_const.DEFAULT_AUDIO_OUTPUT_DIR) as dir_entries:
+            for dir_entry in dir_entries:
+                stem, ext = os.path.splitext(dir_entry.name)
+
+                if ext != global_const.DEFAULT_AUDIO_OUTPUT_FILE_EXT:
+                    continue
+
+                if stem == global_const.DEFAULT_AUDIO_OUTPUT_FILE_STEM:
+                    last_counter = max(last_counter, 0)
+
+                elif stem.startswith(f"{global_const.DEFAULT_AUDIO_OUTPUT_FILE_STEM}_"):
+                    suffix: str = stem[len(global_const.DEFAULT_AUDIO_OUTPUT_FILE_STEM) + 1:]
+
+                    if suffix.isdecimal():
+                        last_counter = max(last_counter, int(suffix))
+
+    except FileNotFoundError:
+        pass
+
+    return last_counter
+
+
+@lru_cache(maxsize=1)
+def build_audio_elements(tone: int, volume: float, sample_rate: int, wpm: int) -> dict:
+    """Synthesize the elements of Morse code audio, i.e. the dit
+    and dah tones, and the spaces after a symbol, a letter and a word,
+    as 16-bit PCM frames. The elements of the most recent audio
+    settings are cached, as they only depend on them.
+
+    Args:
+        tone: int: Tone frequency in Hz.
+        volume: float: Tone volume.
+        sample_rate: int: Number of samples per second.
+        wpm: int: Speed in words per minute.
+
+    Returns:
+        dict: The frames by element (pycw.DIT, pycw.DAH, "symbol_space",
+              "letter_space", and "word_space").
+    """
+
+    import pycw  # Deferred to the first generation to speed up startup
+
+    # Element durations computed exactly as pycw does, since the frame
+    # counts are truncated, so that the audio is identical
+    dit_duration: float = 1.2 / wpm
+    dah_duration: float = dit_duration * 3
+    symbol_space_duration: float = dit_duration
+    letter_space_duration: float = (dit_duration * 3) - symbol_space_duration
+    word_space_duration: float = (dit_duration * 7) - letter_space_duration
+    envelope_duration: float = dit_duration / 10
+
+    def sin_wave(duration: float) -> bytes:
+        return pycw.synth.generate_sin_wave(frequency=tone, duration=duration, volume=volume,
+                                            attack=envelope_duration, release=envelope_duration,
+                                            sample_rate=sample_rate).tobytes()
+
+    def silence(duration: float) -> bytes:
+        # Like pycw, the silence is always generated at pycw's default
+        # sample rate
+        return pycw.synth.generate_silence(duration=duration).tobytes()
+
+    return {pycw.DIT: sin_wave(duration=dit_duration),
+            pycw.DAH: sin_wave(duration=dah_duration),
+            "symbol_space": silence(duration=symbol_space_duration),
+            "letter_space": silence(duration=letter_space_duration),
+            "word_space": silence(duration=word_space_duration)}
+
+
+def synthesize_audio(normalized_text: str) -> bytes:
+    """Synthesize the Morse code audio of a sanitized text as 16-bit
+    PCM frames, by joining the cached frames of its elements at once.
+
+    Args:
+        normalized_text: str: Text to be converted into audio.
+
+    Raises:
+        ValueError: If the text contains a character unsupported
+                    by the pycw module.
+
+    Returns:
+        bytes: The audio frames.
+    """
+
+    import pycw  # Deferred to the first generation to speed up startup
+
+    elements: dict = build_audio_elements(tone=global_const.AUDIO_TONE,
+                                          volume=global_const.AUDIO_VOLUME,
+                                          sample_rate=global_const.AUDIO_SAMPLE_RATE,
+                                          wpm=global_const.AUDIO_WPM)
+    symbol_space: bytes = elements["symbol_space"]
+    letter_space: bytes = elements["letter_space"]
+    word_space: bytes = elements["word_space"]
+    frames: list = []
+
+    for letter in pycw.normalize_text(text=normalized_text):
+        if letter == " ":
+            frames.append(word_space)
+            continue
+
+        symbols: tuple = pycw.MORSE_TABLE.get(letter)
+
+        if not symbols:
+            raise ValueError(f"Unsupported symbol: {letter!r}")
+
+        for symbol in symbols:
+            frames.append(elements[symbol])
+            frames.append(symbol_space)
+
+        frames.append(letter_space)
+
+    return b"".join(frames)
+
+
+def find_generated_audio_file(audio_file_key: tuple) -> str:
+    """Find the audio file generated before from the same text with
+    the same audio settings, unless it has been removed or modified
+    since, in which case it's forgotten.
+
+    Args:
+        audio_file_key: tuple: Output directory, text, and audio
+                               settings of the audio file.
+
+    Returns:
+        str: The filepath to the audio file, or an empty string
+             if there's none.
+    """
+
+    if audio_file_key not in generated_audio_files:
+        return ""
+
+    audio_filepath, modification_time = generated_audio_files[audio_file_key]
+
+    try:
+        audio_file_unchanged: bool = os.stat(audio_filepath).st_mtime_ns == modification_time
+    except FileNotFoundError:
+        audio_file_unchanged = False
+
+    if not audio_file_unchanged:
+        # Forget the audio file, as it can't be reused anymore
+        del generated_audio_files[audio_file_key]
+        return ""
+
+    generated_audio_files.move_to_end(audio_file_key)
+
+    return audio_filepath
+
+
+def write_audio_file(audio_data: memoryview) -> str:
+    """Write the audio file under the first unused filename
+    in the output directory.
+
+    Incrementally, the first unused audio filename is found to avoid
+    overwriting previous ones. The search resumes right after
+    the most-recently-generated file as long as it still exists,
+    so that previous filenames don't have to be checked again,
+    or, the first time, after the audio files already in the output
+    directory. Each filename is claimed by creating the audio file
+    exclusively, so no file created meanwhile can be overwritten.
+
+    Args:
+        audio_data: memoryview: Contents of the audio file.
+
+    Raises:
+        PermissionError: If the audio file can't be created.
+        FileNotFoundError: If the audio file can't be created
+                           in the existing output directory.
+
+    Returns:
+        str: The filepath to the written audio file.
+    """
+
+    if global_const.DEFAULT_AUDIO_OUTPUT_DIR not in last_audio_file_counters:
+        last_audio_file_counters[global_const.DEFAULT_AUDIO_OUTPUT_DIR] = find_last_audio_file_counter()
+
+    counter: int = last_audio_file_counters.get(global_const.DEFAULT_AUDIO_OUTPUT_DIR, -1) + 1
+
+    if counter and not os.path.exists(build_audio_filepath(counter=counter - 1)):
+        counter = 0
+
+    while True:
+        audio_filepath: str = build_audio_filepath(counter=counter)
+
+        try:
+            with open(audio_filepath, "xb") as audio_file:
+                audio_file.write(audio_data)
+
+        except FileExistsError:
+            counter += 1
+
+        except FileNotFoundError:
+            # If the directory already exists, the file can't be
+            # created there at all (e.g. the path is too long).
+            if os.path.isdir(global_const.DEFAULT_AUDIO_OUTPUT_DIR):
+                raise
+
+            # Otherwise, create the directory and retry
+            os.makedirs(name=global_const.DEFAULT_AUDIO_OUTPUT_DIR, exist_ok=True)
+
+        else:
+            break
+
+    # Save the counter of the audio file as the most recent one
+    last_audio_file_counters[global_const.DEFAULT_AUDIO_OUTPUT_DIR] = counter
+
+    return audio_filepath
+
+
+def generate_audio_file(normalized_text: str) -> str:
+    """Generate the Morse code audio file from a sanitized text
+    under the first unused filename in the output directory, unless
+    it has already been generated from the same text.
+    The function is run by the audio worker thread, so it mustn't
+    access any widgets.
+
+    Args:
+        normalized_text: str: Text to be converted into audio.
+
+    Raises:
+        PermissionError: If the audio file can't be created.
+
+    Returns:
+        str: The filepath to the generated audio file.
+    """
+
+    # Reuse the audio file generated from the same text with the same
+    # audio settings before, unless it has been removed or modified
+    # since, to skip the synthesis.
+    audio_file_key: tuple = (global_const.DEFAULT_AUDIO_OUTPUT_DIR, normalized_text,
+                             global_const.AUDIO_TONE, global_const.AUDIO_VOLUME,
+                             global_const.AUDIO_SAMPLE_RATE, global_const.AUDIO_WPM)
+    audio_filepath: str = find_generated_audio_file(audio_file_key=audio_file_key)
+
+    if audio_filepath:
+        return audio_filepath
+
+    # Generate the audio according to the specified settings in memory
+    audio_buffer: io.BytesIO = io.BytesIO()
+
+    with wave.open(audio_buffer, "wb") as wave_writer:
+        wave_writer.setnchannels(global_const.AUDIO_CHANNELS)
+        wave_writer.setsampwidth(global_const.AUDIO_SAMPLE_WIDTH)
+        wave_writer.setframerate(global_const.AUDIO_SAMPLE_RATE)
+        wave_writer.writeframes(synthesize_audio(normalized_text=normalized_text))
+
+    audio_filepath = write_audio_file(audio_data=audio_buffer.getbuffer())
+
+    # Remember the audio file for the text, forgetting the least
+    # recently used one if there are too many
+    generated_audio_files[audio_file_key] = (audio_filepath, os.stat(audio_filepath).st_mtime_ns)
+
+    if len(generated_audio_files) > global_const.GENERATED_AUDIO_FILES_CACHE_SIZE:
+        generated_audio_files.popitem(last=False)
+
+    return audio_filepath
+
+
+def complete_audio_file(future: Future, audio_status: tk.Entry, generation: int) -> None:
+    """Display the outcome of the audio file generation once
+    the audio worker thread has finished it. Until then, the check
+    is rescheduled on the Tk event loop, so that the widgets are only
+    ever modified by the main thread. The outcome is discarded
+    if another audio file generation has been started since.
+
+    Args:
+        future: Future: The audio file generation task.
+        audio_status: tk.Entry: Audio status entry widget.
+        generation: int: Token of the audio file generation.
+
+    Returns:
+        None
+    """
+
+    if generation != audio_file_generation:
+        return
+
+    if not future.done():
+        audio_status.after(global_const.AUDIO_STATUS_POLL_INTERVAL, complete_audio_file,
+                           future, audio_status, generation)
+        return
+
+    try:
+        audio_filepath: str = future.result()
+
+    except PermissionError:
+        # Display an error if the audio file can't be created
+        # due to lack of permission.
+        messagebox.showerror(title=global_const.MESSAGEBOX_TITLE_ERROR,
+                             message=global_const.MESSAGEBOX_MSG_TO_MORSE_PERM_ERROR)
+
+    except (OSError, ValueError) as e:
+        # Display an error if the audio file can't be created
+        # for any other reason, e.g. the text contains a character
+        # unsupported by the pycw module.
+        messagebox.showerror(title=global_const.MESSAGEBOX_TITLE_ERROR, message=str(e))
+
+    else:
+        # Save the audio filepath as the most recent one
+        change_most_recent_filepath(change_to=audio_filepath)
+        change_entry_text(entry_to_change=audio_status,
+                          change_to=f"{global_const.AUDIO_READY_MESSAGE} {most_recent_audio_filepath}")
+
+
+def create_audio_file(normalized_text: str, audio_status: tk.Entry, *, in_background: bool = False,
+                      sanitized_text: Optional[str] = None) -> None:
     """Generate the Morse code audio file from a normalized text.
 
+    The audio file is generated by the audio worker thread. Unless
+    it's requested to be generated in the background, the function
+    waits for the audio file to be ready.
+
     Args:
         normalized_text (str): Text to be converted into audio.
         audio_status: tk.Entry: Audio status entry widget.
+        in_background: bool: Whether to return without waiting
+                             for the audio file; defaults to False.
+        sanitized_text: Optional[str]: The normalized text with
+                                       the characters unsupported
+                                       by the pycw module already
+                                       removed, if the caller has
+                                       done so; defaults to None.
 
     Raises:
         PermissionError: If the audio file can't be created.
@@ -133,58 +544,145 @@ def create_audio_file(normalized_text: str, audio_status: tk.Entry) -> None:
                              message=global_const.MESSAGEBOX_MSG_CREATE_AUDIO_SECOND_ARG_WRONG_ERROR)
         return
 
+    # Remove the chars unsupported by the pycw module, unless
+    # the caller has already done so.
+    if sanitized_text is None:
+        sanitized_text = global_const.PATT_SANITIZE_PLAIN_TEXT_INPUT.sub(repl="", string=normalized_text)
+
     # Check whether the normalized_text contains any chars unsupported
     # by the pycw module.
-    if re.search(pattern=global_const.PATT_SANITIZE_PLAIN_TEXT_INPUT, string=normalized_text):
+    if sanitized_text != normalized_text:
 
         # If so, ask the user whether to automatically remove them
         # from the text, or whether to abandon audio generation.
         if messagebox.askyesno(title=global_const.MESSAGEBOX_TITLE_CONFIRM,
                                message=global_const.MESSAGEBOX_MSG_AUTO_CLEANUP_CONFIRM):
-            normalized_text = re.sub(pattern=global_const.PATT_SANITIZE_PLAIN_TEXT_INPUT, repl="",
-                                     string=normalized_text)
+            normalized_text = sanitized_text
 
         else:
-            change_most_recent_filepath()
+            discard_audio_file()
             change_entry_text(entry_to_change=audio_status)
             return
 
-    # Incrementally, find the first unused audio filename to avoid
-    # overwriting previous ones.
-    counter: int = 0
-    audio_filepath: str = f"{global_const.DEFAULT_AUDIO_OUTPUT_DIR}/{global_const.DEFAULT_AUDIO_OUTPUT_FILE}"
-    audio_file_name, audio_file_ext = os.path.splitext(p=audio_filepath)
+    # Discard the previous audio file, so that it can't be played back
+    # as the audio of this text while this one is being generated.
+    generation: int = discard_audio_file()
+    change_entry_text(entry_to_change=audio_status)
 
-    # Create the directory if it doesn't exist yet
-    # Generate the audio file according to the specified settings
-    try:
-        os.makedirs(name=global_const.DEFAULT_AUDIO_OUTPUT_DIR, exist_ok=True)
+    # Synthesizing and writing the audio takes a while, so it's done
+    # by the audio worker thread to keep the GUI responsive. Having
+    # a single worker also ensures two audio files are never being
+    # assigned the same filename at once.
+    future: Future = audio_executor.submit(generate_audio_file, normalized_text)
 
-        while os.path.exists(audio_filepath):
-            counter += 1
-            audio_filepath = f"{audio_file_name}_{counter}{audio_file_ext}"
-
-        pycw.output_wave(file=audio_filepath,
-                         text=normalized_text,
-                         tone=global_const.AUDIO_TONE,
-                         volume=global_const.AUDIO_VOLUME,
-                         sample_rate=global_const.AUDIO_SAMPLE_RATE,
-                         wpm=global_const.AUDIO_WPM)
-    except PermissionError:
-        # Display an error if the audio file can't be created
-        # due to lack of permission.
-        messagebox.showerror(title=global_const.MESSAGEBOX_TITLE_ERROR,
-                             message=global_const.MESSAGEBOX_MSG_TO_MORSE_PERM_ERROR)
+    if not in_background:
+        wait(fs=(future,))
 
-    else:
-        # Save the audio filepath as the most recent one
-        change_most_recent_filepath(change_to=audio_filepath)
-        change_entry_text(entry_to_change=audio_status,
-                          change_to=f"{global_const.AUDIO_READY_MESSAGE} {most_recent_audio_filepath}")
+    complete_audio_file(future=future, audio_status=audio_status, generation=generation)
+
+
+def fold_decomposable_letters(text: str) -> str:
+    """Strip the combining marks off the decomposable letters of a text
+    (unicodedata canonical NFD decomposition), provided that the text
+    consists of ASCII characters and such letters only. Anything else,
+    e.g. a symbol with a combining mark (such as "≠") or a punctuation
+    mark decomposing into another one, is left to 'unidecode'.
+
+    Args:
+        text: str: Text to fold.
+
+    Returns:
+        str: The folded ASCII text, or an empty string if the text
+             can't be folded this way.
+    """
+
+    # Only letters and the combining marks attached to them qualify
+    if not all(char.isascii() or unicodedata.category(char)[0] in "LM" for char in text):
+        return ""
+
+    folded_chars: list = []
+    base_is_letter: bool = False
+
+    for char in unicodedata.normalize("NFD", text):
+        if unicodedata.combining(char):
+            # Strip the mark only if it's attached to a letter
+            if not base_is_letter:
+                return ""
+
+            continue
+
+        if not char.isascii():
+            return ""
+
+        base_is_letter = unicodedata.category(char).startswith("L")
+        folded_chars.append(char)
+
+    return "".join(folded_chars)
+
+
+@lru_cache(maxsize=global_const.NORMALIZED_TEXT_CACHE_SIZE)
+def normalize_plain_text(user_plain_text: str) -> str:
+    """Normalize a plain text for translation into Morse code,
+    i.e. eliminate diacritical letters by finding the closest ASCII
+    representations for all characters, convert it to uppercase,
+    and strip it. The most recently normalized texts are cached.
+
+    Args:
+        user_plain_text: str: Text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+
+    normalized_text: str = user_plain_text
+
+    # Unless the text is plain ASCII (the common case), eliminate
+    # diacritical letters of the Latin-1 Supplement block with
+    # a precomputed table, then strip the combining marks off
+    # the remaining decomposable letters, finding the closest ASCII
+    # representations of the non-ASCII characters only if there are
+    # still any left.
+    if not normalized_text.isascii():
+        normalized_text = normalized_text.translate(global_const.LATIN_1_TO_ASCII_TABLE)
+
+        if not normalized_text.isascii():
+            decomposed_text: str = fold_decomposable_letters(text=normalized_text)
+
+            if decomposed_text:
+                normalized_text = decomposed_text
+
+            else:
+                import unidecode  # Deferred to the first use to speed up startup
+
+                normalized_text = unidecode.unidecode(string=normalized_text)
+
+    return normalized_text.upper().strip()
+
+
+@lru_cache(maxsize=global_const.MORSE_CODE_CACHE_SIZE)
+def encode_morse_code(normalized_text: str) -> str:
+    """Encode a normalized (ASCII, uppercase) text as Morse code.
+    The whole text is translated in a single str.translate pass once
+    the words are separated by single spaces, so that letters are
+    separated with a space, while the words are separated by a slash
+    with a space on either side. Characters without a Morse code
+    equivalent are skipped. The Morse code of the most recently
+    encoded texts is cached.
+
+    Args:
+        normalized_text: str: Normalized text to encode.
+
+    Returns:
+        str: The Morse code.
+    """
+
+    single_spaced_text: str = " ".join(normalized_text.split())
+
+    return single_spaced_text.translate(global_const.MORSE_CODE_TRANS_TABLE).rstrip()
 
 
 def translate_to_morse_code(user_plain_text: str, audio_request: bool, audio_status: tk.Entry,
-                            output_entry: tk.Entry) -> None:
+                            output_entry: tk.Entry, *, in_background: bool = False) -> None:
     """Translate the text entered by the user into Morse code
     and display it in the GUI. The function also calls
     'create_audio_file' to generate the corresponding
@@ -195,6 +693,8 @@ def translate_to_morse_code(user_plain_text: str, audio_request: bool, audio_sta
         audio_request: bool: Whether to generate the audio.
         audio_status: tk.Entry: Audio status entry widget.
         output_entry: tk.Entry: Output entry widget.
+        in_background: bool: Whether to generate the audio file
+                             in the background; defaults to False.
 
     Returns:
         None
@@ -221,36 +721,28 @@ def translate_to_morse_code(user_plain_text: str, audio_request: bool, audio_sta
         return
 
     if user_plain_text:
-        # Eliminate diacritical letters by finding the closest ASCII
-        # representations for all characters.
-        normalized_text: str = unidecode.unidecode(string=user_plain_text).upper().strip()
-        split_user_text: list = normalized_text.split()
+        normalized_text: str = normalize_plain_text(user_plain_text=user_plain_text)
 
         # Remove all illegal characters from normalized_text
-        sanitized_text: str = re.sub(pattern=global_const.PATT_SANITIZE_PLAIN_TEXT_INPUT, repl="",
-                                     string=normalized_text)
+        sanitized_text: str = global_const.PATT_SANITIZE_PLAIN_TEXT_INPUT.sub(repl="", string=normalized_text)
 
         # If the result of the above is an empty string, the clear
         # most_recent_filepath variable, and the audio_status widget,
         # and display the appropriate warning message to the user.
         if not sanitized_text:
-            change_most_recent_filepath()
+            discard_audio_file()
             change_entry_text(entry_to_change=audio_status)
             messagebox.showwarning(title=global_const.MESSAGEBOX_TITLE_WARNING,
                                    message=global_const.MESSAGEBOX_MSG_MEANINGLESS_INPUT_WARNING)
             return
 
         # Translate the normalized text to Morse code.
-        # Letters are looked up in the MORSE_CODE_DICT, and they're
-        # separated by a space, while the words are separated
-        # by a slash with a space on either side.
-        mcode: str = " / ".join(" ".join(map(lambda c: global_const.MORSE_CODE_DICT.get(c, ""), word)) for word
-                                in split_user_text)
-        mcode = mcode.strip()
+        mcode: str = encode_morse_code(normalized_text=normalized_text)
         change_entry_text(entry_to_change=output_entry, change_to=mcode)
 
         if audio_request:
-            create_audio_file(normalized_text=normalized_text, audio_status=audio_status)
+            create_audio_file(normalized_text=normalized_text, audio_status=audio_status,
+                              in_background=in_background, sanitized_text=sanitized_text)
 
     else:
         # Display a warning if the user has not provided any input
@@ -259,7 +751,8 @@ def translate_to_morse_code(user_plain_text: str, audio_request: bool, audio_sta
 
 
 def translate_to_plain_text(user_morse_code_text: str, audio_request: bool,
-                            audio_status: tk.Entry, output_entry: tk.Entry) -> None:
+                            audio_status: tk.Entry, output_entry: tk.Entry, *,
+                            in_background: bool = False) -> None:
     """Translate the Morse code entered by the user into plain text,
     and display it in the GUI.
 
@@ -268,6 +761,8 @@ def translate_to_plain_text(user_morse_code_text: str, audio_request: bool,
         audio_request: bool: Whether to generate the audio.
         audio_status: tk.Entry: Audio status entry widget.
         output_entry: tk.Entry: Output entry widget.
+        in_background: bool: Whether to generate the audio file
+                             in the background; defaults to False.
 
     Returns:
         None
@@ -300,7 +795,7 @@ def translate_to_plain_text(user_morse_code_text: str, audio_request: bool,
         return
 
     # Check if only legal chars are contained in user_morse_code_text
-    only_legal = re.fullmatch(pattern=global_const.PATT_SANITIZE_MORSE_CODE_INPUT, string=user_morse_code_text)
+    only_legal = global_const.PATT_SANITIZE_MORSE_CODE_INPUT.fullmatch(string=user_morse_code_text)
 
     if not only_legal:
         # Display a warning if the user has provided illegal chars
@@ -308,35 +803,28 @@ def translate_to_plain_text(user_morse_code_text: str, audio_request: bool,
                                message=global_const.MESSAGEBOX_MSG_TRANSLATE_TO_PLAIN_WARNING)
         return
 
-    # Replace each occurrence of two spaces or more with one space
-    user_morse_code_text_reduced: str = re.sub(pattern=global_const.PATT_REDUCE_SPACES_MORSE_CODE_INPUT,
-                                               repl=" ",
-                                               string=user_morse_code_text)
-    # Split the user's input into a list of words
-    split_user_morse_code_text: list = user_morse_code_text_reduced.split(sep=" / ")
-
-    # Create the dictionary with switched keys and values
-    switched_morse_code_dict: dict = {v: k for k, v in global_const.MORSE_CODE_DICT.items()}
-
-    # Translate the Morse code to plain text.
-    # Symbols are looked up in switched_morse_code_dict,
-    # and the words are separated by a space.
-    plain_text: str = " ".join("".join(map(lambda c: switched_morse_code_dict.get(c, ""), word.split())) for word
-                               in split_user_morse_code_text).strip()
+    # Translate the Morse code to plain text in a single pass over
+    # its symbols, split on any number of spaces. Symbols are decoded
+    # by MORSE_CODE_DECODE_SYMBOL, which maps the word separator to
+    # a space and unknown symbols to an empty string, mapped over them,
+    # so that the loop runs in C.
+    # Consecutive word separators are then reduced to a single space.
+    plain_text: str = " ".join("".join(map(global_const.MORSE_CODE_DECODE_SYMBOL,
+                                           user_morse_code_text.split())).split())
 
     if plain_text:
         # Change the output_entry text to plain_text value
         # if it's not an empty str.
         change_entry_text(entry_to_change=output_entry, change_to=plain_text)
         if audio_request:
-            create_audio_file(normalized_text=plain_text, audio_status=audio_status)
+            create_audio_file(normalized_text=plain_text, audio_status=audio_status, in_background=in_background)
 
     else:
         # If output_entry is an empty string, erase
         # any text in the most_recent_audio_filepath
         # and in audio_status, then display a warning
         # about the meaningless input.
-        change_most_recent_filepath()
+        discard_audio_file()
         change_entry_text(entry_to_change=audio_status)
         messagebox.showwarning(title=global_const.MESSAGEBOX_TITLE_WARNING,
                                message=global_const.MESSAGEBOX_MSG_MEANINGLESS_INPUT_WARNING)
@@ -360,6 +848,8 @@ def copy_to_clipboard(text_to_copy: str) -> None:
     if text_to_copy:
         # Copy text to the system clipboard and display
         # a success message to the user.
+        import pyperclip  # Deferred to the first use to speed up startup
+
         pyperclip.copy(text=text_to_copy)
         messagebox.showinfo(title=global_const.MESSAGEBOX_TITLE_SUCCESS,
                             message=global_const.MESSAGEBOX_MSG_COPY_SUCCESS)
@@ -395,4 +885,4 @@ def clear_all(*args: tk.Entry) -> None:
     for widget in args:
         change_entry_text(entry_to_change=widget)
 
-    change_most_recent_filepath()
+    discard_audio_file()
@@ -5,18 +5,69 @@ It declares the app title, Morse code lookup dictionary, GUI style,
 output audio settings, tkinter.messagebox messages and regex patterns.
 """
 
+import os
 import re
+from types import MappingProxyType
+from typing import Callable
 
 APP_TITLE: str = "Morse Code Translator & Audio Generator v1.0.1"
-MORSE_CODE_DICT: dict = {"A": ".-", "B": "-...", "C": "-.-.", "D": "-..", "E": ".", "F": "..-.", "G": "--.",
-                         "H": "....", "I": "..", "J": ".---", "K": "-.-", "L": ".-..", "M": "--", "N": "-.",
-                         "O": "---", "P": ".--.", "Q": "--.-", "R": ".-.", "S": "...", "T": "-", "U": "..-",
-                         "V": "...-", "W": ".--", "X": "-..-", "Y": "-.--", "Z": "--..", "0": "-----", "1": ".----",
-                         "2": "..---", "3": "...--", "4": "....-", "5": ".....", "6": "-....", "7": "--...",
-                         "8": "---..", "9": "----.", ".": ".-.-.-", ",": "--..--", "'": ".----.", "\"": ".-..-.",
-                         "_": "..--.-", ":": "---...", ";": "-.-.-.", "?": "..--..", "!": "-.-.--", "-": "-....-",
-                         "+": ".-.-.", "/": "-..-.", "(": "-.--.", ")": "-.--.-", "=": "-...-", "@": ".--.-.",
-                         "$": "...-..-", "&": ".-..."}
+MORSE_CODE_DICT: MappingProxyType = MappingProxyType({
+    "A": ".-", "B": "-...", "C": "-.-.", "D": "-..", "E": ".", "F": "..-.", "G": "--.",
+    "H": "....", "I": "..", "J": ".---", "K": "-.-", "L": ".-..", "M": "--", "N": "-.",
+    "O": "---", "P": ".--.", "Q": "--.-", "R": ".-.", "S": "...", "T": "-", "U": "..-",
+    "V": "...-", "W": ".--", "X": "-..-", "Y": "-.--", "Z": "--..", "0": "-----", "1": ".----",
+    "2": "..---", "3": "...--", "4": "....-", "5": ".....", "6": "-....", "7": "--...",
+    "8": "---..", "9": "----.", ".": ".-.-.-", ",": "--..--", "'": ".----.", "\"": ".-..-.",
+    "_": "..--.-", ":": "---...", ";": "-.-.-.", "?": "..--..", "!": "-.-.--", "-": "-....-",
+    "+": ".-.-.", "/": "-..-.", "(": "-.--.", ")": "-.--.-", "=": "-...-", "@": ".--.-.",
+    "$": "...-..-", "&": ".-..."
+})
+
+# Dictionary with switched keys and values of MORSE_CODE_DICT
+# for translating Morse code back to plain text. Both dictionaries
+# are read-only views, so the lookups can't be modified at runtime.
+MORSE_CODE_DICT_INV: MappingProxyType = MappingProxyType({v: k for k, v in MORSE_CODE_DICT.items()})
+
+
+class MorseCodeDecodeDict(dict):
+    """Dictionary returning an empty string for missing keys
+    (without inserting them), so that it can be subscripted
+    directly instead of through get with a default value."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+# Function decoding a Morse code symbol, i.e. the bound __getitem__
+# method of a dictionary which also maps the word separator to a space,
+# and unknown symbols to an empty string. The decoder maps it over
+# the symbols, as subscripting the dictionary through a read-only view
+# is several times slower.
+MORSE_CODE_DECODE_SYMBOL: Callable[[str], str] = MorseCodeDecodeDict({**MORSE_CODE_DICT_INV, "/": " "}).__getitem__
+
+# Read-only view of the dictionary behind MORSE_CODE_DECODE_SYMBOL
+MORSE_CODE_DECODE_DICT: MappingProxyType = MappingProxyType(MORSE_CODE_DECODE_SYMBOL.__self__)
+
+# Translation table for str.translate mapping the letters of the Latin-1
+# Supplement block (the most common diacritical letters) to their closest
+# ASCII representations.
+LATIN_1_TO_ASCII_TABLE: dict = {**str.maketrans("ÀÁÂÃÄÅÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝàáâãäåçèéêëìíîïðñòóôõö÷øùúûüýÿ",
+                                                "AAAAAACEEEEIIIIDNOOOOOxOUUUUYaaaaaaceeeeiiiidnooooo/ouuuuyy"),
+                                **str.maketrans({"Æ": "AE", "Þ": "Th", "ß": "ss", "æ": "ae", "þ": "th"})}
+
+# Translation table for str.translate indexed by the code points
+# of ASCII characters, mapping each of them to its Morse code followed
+# by a space (the letter separator), and a space to a slash followed
+# by a space (completing the word separator). Characters without
+# a Morse code equivalent are deleted.
+MORSE_CODE_TRANS_TABLE: tuple = tuple(f"{MORSE_CODE_DICT[chr(i)]} " if chr(i) in MORSE_CODE_DICT
+                                      else "/ " if chr(i) == " " else None for i in range(128))
+
+NORMALIZED_TEXT_CACHE_SIZE: int = 128  # Number of the most recently normalized texts that are cached
+MORSE_CODE_CACHE_SIZE: int = 128  # Number of the most recently encoded texts whose Morse code is cached
+GENERATED_AUDIO_FILES_CACHE_SIZE: int = 128  # Number of the most recently generated audio files remembered for reuse
 
 # ~ Colors ~
 ROOT_BG_COLOR: str = "#FFF"  # White
@@ -32,9 +83,11 @@ STATIC_TEXT_COLOR: str = "#003366"  # Prussian Blue
 BUTTON_TEXT_COLOR: str = "#FFF"  # White
 
 # ~ Images, Filepaths, Dimensions & Padding ~
-LOGO_FILEPATH: str = "images/app_logo.png"
+PROJECT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGO_FILEPATH: str = os.path.join(PROJECT_DIR, "images", "app_logo.png")
 DEFAULT_AUDIO_OUTPUT_DIR: str = "output"
 DEFAULT_AUDIO_OUTPUT_FILE: str = "morse_code_audio.wav"
+DEFAULT_AUDIO_OUTPUT_FILE_STEM, DEFAULT_AUDIO_OUTPUT_FILE_EXT = os.path.splitext(DEFAULT_AUDIO_OUTPUT_FILE)
 
 IMG_WIDTH: int = 400
 IMG_HEIGHT: int = 300
@@ -80,6 +133,24 @@ FONT_CHECKBOX: tuple[str, int, str] = ("Arial", 11, "normal")
 FONT_BUTTON: tuple[str, int, str] = ("Arial", 10, "normal")
 FONT_INFO: tuple[str, int, str] = ("Arial", 10, "normal")
 
+# ~ Widget Options ~
+# Options shared by the widgets of the same kind
+LABEL_OPTIONS: dict = {"fg": STATIC_TEXT_COLOR,
+                       "bg": ROOT_BG_COLOR,
+                       "font": FONT_LABEL}
+LABEL_INFO_OPTIONS: dict = {**LABEL_OPTIONS, "font": FONT_INFO}
+
+BUTTON_PRIMARY_OPTIONS: dict = {"font": FONT_BUTTON,
+                                "width": BUTTON_WIDTH,
+                                "bg": BUTTON_PRIMARY_BG_COLOR,
+                                "fg": BUTTON_TEXT_COLOR,
+                                "activebackground": BUTTON_PRIMARY_PRESSED_BG_COLOR,
+                                "activeforeground": BUTTON_TEXT_COLOR,
+                                "border": BUTTON_BORDER_WIDTH}
+BUTTON_SECOND_OPTIONS: dict = {**BUTTON_PRIMARY_OPTIONS,
+                               "bg": BUTTON_SECOND_BG_COLOR,
+                               "activebackground": BUTTON_SECOND_PRESSED_BG_COLOR}
+
 # ~ MessageBox ~
 # ~~ Titles ~~
 MESSAGEBOX_TITLE_SUCCESS: str = "Success"
@@ -93,7 +164,7 @@ MESSAGEBOX_MSG_COPY_SUCCESS: str = "The text has been successfully copied to you
 
 # ~~~ Confirmations ~~~
 MESSAGEBOX_MSG_AUTO_CLEANUP_CONFIRM: str = "Your input contains characters that are unsupported for audio" \
-                                             " generation (~`<>\\|*^%@#). Would you like to proceed and have them" \
+                                             " generation (~`<>\\|*^%@#[]{}). Would you like to proceed and have them" \
                                              " removed automatically?"
 
 # ~~~ Warnings ~~~
@@ -164,18 +235,16 @@ MESSAGEBOX_MSG_TO_PLAIN_FOURTH_ARG_WRONG_ERROR: str = "The fourth argument (outp
 AUDIO_TONE: int = 800
 AUDIO_VOLUME: float = 1.0
 AUDIO_SAMPLE_RATE: int = 44100
+AUDIO_CHANNELS: int = 1  # Mono
+AUDIO_SAMPLE_WIDTH: int = 2  # Bytes per sample (16-bit)
 AUDIO_WPM: int = 20  # Words per Minute
 AUDIO_READY_MESSAGE: str = "READY:"
+AUDIO_STATUS_POLL_INTERVAL: int = 50  # Milliseconds between checks whether the audio file is ready
+WARM_UP_IMPORTS_DELAY: int = 10  # Milliseconds after startup before the deferred modules are loaded
 
 # ~ Regex Patterns ~
-PATT_SANITIZE_MORSE_CODE_INPUT = re.compile(r"""
-    [.\-/ ]+   # Match one or more of these characters (only they can be translated from Morse code to plain text)
-""", re.VERBOSE)
-
-PATT_SANITIZE_PLAIN_TEXT_INPUT = re.compile(r"""
-    [~`<>\\|*^%@#]+    # Match any of these characters (they are unsupported by the pycw module)
-""", re.VERBOSE)
+# Match one or more of these characters (only they can be translated from Morse code to plain text)
+PATT_SANITIZE_MORSE_CODE_INPUT = re.compile(r"[.\-/ ]+")
 
-PATT_REDUCE_SPACES_MORSE_CODE_INPUT = re.compile(r"""
-    \s{2,}   # Match at least two white-space characters
-""", re.VERBOSE)
+# Match any of these characters (they are unsupported by the pycw module)
+PATT_SANITIZE_PLAIN_TEXT_INPUT = re.compile(r"[~`<>\\|*^%@#\[\]{}]+")
@@ -5,15 +5,20 @@ edge cases.
 The tested functions are:
 1. play_audio_file,
 2. create_audio_file,
-3. translate_to_morse_code,
-4. and translate_to_plain_text.
+3. normalize_plain_text,
+4. encode_morse_code,
+5. translate_to_morse_code,
+6. and translate_to_plain_text.
 """
 
 import os
 import tempfile
+import time
 import tkinter as tk
+from concurrent.futures import Future
 from unittest.mock import patch, PropertyMock
 import pytest
+import pycw
 from playsound3.playsound3 import PlaysoundException
 
 import morsecode.functions as functions
@@ -104,6 +109,20 @@ class Test_PlayAudioFile:
                 title=global_const.MESSAGEBOX_TITLE_ERROR,
                 message=error_message)
 
+    def test_not_blocking(self) -> None:
+        """Test whether the function starts playing back the audio file
+        without waiting for the playback to finish.
+
+        Returns:
+              None
+        """
+
+        with patch(target="playsound3.playsound") as mock_playsound:
+            functions.play_audio_file(audio_status=TEST_TEXT)  # The value doesn't matter as long as it's not empty.
+            assert mock_playsound.called, "The audio file wasn't played back."
+
+            mock_playsound.assert_called_once_with(sound=functions.most_recent_audio_filepath, block=False)
+
     def test_no_file_yet(self) -> None:
         """Test whether the function displays a warning message with
         the expected title and content in the event the argument
@@ -268,6 +287,27 @@ class Test_CreateAudioFile:
                 message=global_const.MESSAGEBOX_MSG_AUTO_CLEANUP_CONFIRM
             )
 
+    def test_sanitized_text_passed(self, tk_root) -> None:
+        """Test whether the function displays the confirmation prompt
+        without sanitizing the input again when it's passed
+        the already sanitized text.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with patch(target="functions.messagebox.askyesno", return_value=False) as mock_askyesno, \
+                patch(target="morsecode.globals.PATT_SANITIZE_PLAIN_TEXT_INPUT") as mock_pattern:
+            functions.create_audio_file(normalized_text="@test#", audio_status=audio_status, sanitized_text="test")
+
+            assert mock_askyesno.called, "The confirmation prompt wasn't displayed."
+            assert not mock_pattern.method_calls, "The input was sanitized again."
+
     def test_happy_path(self, tk_root) -> None:
         """Test whether the function can create an audio file given
         the right arguments.
@@ -301,6 +341,323 @@ class Test_CreateAudioFile:
             ready_message: str = f"{global_const.AUDIO_READY_MESSAGE} {audio_filepath}"
             assert audio_status.get() == ready_message, "The entry audio_status wasn't set to ready_message."
 
+    def test_consecutive_files(self, tk_root) -> None:
+        """Test whether the function creates consecutive audio files
+        without overwriting the previous ones, and whether it starts
+        over from the default filename once the most-recently-generated
+        file has been removed.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            first_filepath: str = f"{tmp_dir}/{global_const.DEFAULT_AUDIO_OUTPUT_FILE}"
+            second_filepath: str = f"{tmp_dir}/morse_code_audio_1.wav"
+
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+            functions.create_audio_file(normalized_text="Another test text", audio_status=audio_status)
+
+            assert os.path.exists(first_filepath), f"The file {first_filepath} wasn't created."
+            assert os.path.exists(second_filepath), f"The file {second_filepath} wasn't created."
+            assert functions.most_recent_audio_filepath == second_filepath, \
+                "The variable 'most_recent_audio_filepath' wasn't set to the second audio filepath."
+
+            os.remove(first_filepath)
+            os.remove(second_filepath)
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            assert functions.most_recent_audio_filepath == first_filepath, \
+                "The search for an unused audio filename didn't start over."
+
+    @pytest.mark.parametrize("wpm", [5, 6, 7, 8, 12, 15, 20, 24, 27, 30, 45, 49, 56])
+    def test_same_audio_as_pycw(self, tk_root, wpm) -> None:
+        """Test whether the generated audio file is identical
+        to the one generated by the pycw module with the same
+        audio settings, at various speeds.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+            wpm: Speed in words per minute.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+        normalized_text: str = "SOS 2 SEAS, OK?"
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir), \
+                patch(target="morsecode.globals.AUDIO_WPM", new=wpm):
+            pycw_filepath: str = f"{tmp_dir}/pycw.wav"
+            pycw.output_wave(file=pycw_filepath,
+                             text=normalized_text,
+                             tone=global_const.AUDIO_TONE,
+                             volume=global_const.AUDIO_VOLUME,
+                             sample_rate=global_const.AUDIO_SAMPLE_RATE,
+                             wpm=wpm)
+
+            functions.create_audio_file(normalized_text=normalized_text, audio_status=audio_status)
+
+            with open(pycw_filepath, "rb") as pycw_file, \
+                    open(functions.most_recent_audio_filepath, "rb") as audio_file:
+                assert audio_file.read() == pycw_file.read(), "The audio file didn't match the pycw one."
+
+    def test_missing_output_dir(self, tk_root) -> None:
+        """Test whether the function creates the output directory
+        in the event it doesn't exist.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=f"{tmp_dir}/output"):
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            assert os.path.exists(functions.build_audio_filepath()), "The audio file wasn't created."
+
+    def test_existing_file_not_overwritten(self, tk_root) -> None:
+        """Test whether the function leaves a file already existing
+        under the default filename intact, and generates the audio
+        file under the next one.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            existing_filepath: str = f"{tmp_dir}/{global_const.DEFAULT_AUDIO_OUTPUT_FILE}"
+            audio_filepath: str = functions.build_audio_filepath(counter=1)
+
+            with open(existing_filepath, "wb") as existing_file:
+                existing_file.write(b"existing")
+
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            with open(existing_filepath, "rb") as existing_file:
+                assert existing_file.read() == b"existing", f"The file {existing_filepath} was overwritten."
+
+            assert functions.most_recent_audio_filepath == audio_filepath, \
+                "The variable 'most_recent_audio_filepath' wasn't set to the next audio filepath."
+
+    def test_after_previous_files(self, tk_root) -> None:
+        """Test whether the function generates the first audio file
+        after the audio files already in the output directory.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            open(functions.build_audio_filepath(counter=4), "wb").close()
+
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            assert functions.most_recent_audio_filepath == functions.build_audio_filepath(counter=5), \
+                "The audio file wasn't generated after the previous ones."
+
+    def test_same_text_reused(self, tk_root) -> None:
+        """Test whether the function reuses the audio file generated
+        from the same text before, and whether it generates the audio
+        file again once the previous one has been removed.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            audio_filepath: str = f"{tmp_dir}/{global_const.DEFAULT_AUDIO_OUTPUT_FILE}"
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            with patch(target="morsecode.functions.synthesize_audio") as mock_synthesize_audio:
+                functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+                assert not mock_synthesize_audio.called, "The audio file was generated again."
+
+            assert os.listdir(tmp_dir) == [global_const.DEFAULT_AUDIO_OUTPUT_FILE], \
+                "Another audio file was created."
+            assert functions.most_recent_audio_filepath == audio_filepath, \
+                "The variable 'most_recent_audio_filepath' wasn't set to the reused audio filepath."
+
+            os.remove(audio_filepath)
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+            assert os.path.exists(audio_filepath), f"The file {audio_filepath} wasn't created again."
+
+    def test_generated_files_capped(self, tk_root) -> None:
+        """Test whether the function forgets the least recently used
+        audio file once too many have been generated, and the ones
+        that have been removed.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir), \
+                patch(target="morsecode.globals.GENERATED_AUDIO_FILES_CACHE_SIZE", new=2), \
+                patch.dict(in_dict=functions.generated_audio_files, clear=True):
+            for normalized_text in ("A", "B", "A", "C"):
+                functions.create_audio_file(normalized_text=normalized_text, audio_status=audio_status)
+
+            assert [key[1] for key in functions.generated_audio_files] == ["A", "C"], \
+                "The least recently used audio file wasn't forgotten."
+
+            audio_file_key, (audio_filepath, _) = next(iter(functions.generated_audio_files.items()))
+            os.remove(audio_filepath)
+
+            assert functions.find_generated_audio_file(audio_file_key=audio_file_key) == "", \
+                "The removed audio file was found."
+            assert [key[1] for key in functions.generated_audio_files] == ["C"], \
+                "The removed audio file wasn't forgotten."
+
+    def test_same_text_other_settings(self, tk_root) -> None:
+        """Test whether the function generates the audio file again
+        from the same text once the audio settings have changed.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            with patch(target="morsecode.globals.AUDIO_WPM", new=global_const.AUDIO_WPM + 5):
+                functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status)
+
+            assert functions.most_recent_audio_filepath == functions.build_audio_filepath(counter=1), \
+                "The audio file generated with the previous audio settings was reused."
+
+    def test_in_background(self, tk_root) -> None:
+        """Test whether the function returns without waiting for
+        the audio file when it's requested to be generated
+        in the background, and whether the audio status is updated
+        by the Tk event loop once the audio file is ready.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+        audio_status.config(state="readonly")
+        audio_status.pack()
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            audio_filepath: str = f"{tmp_dir}/{global_const.DEFAULT_AUDIO_OUTPUT_FILE}"
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status, in_background=True)
+
+            # Wait for the audio worker thread, then let the event loop
+            # pick up the outcome.
+            functions.audio_executor.submit(int).result()
+            deadline: float = time.monotonic() + 5
+
+            while not audio_status.get() and time.monotonic() < deadline:
+                tk_root.update()
+                time.sleep(0.01)
+
+            assert os.path.exists(audio_filepath), f"The file {audio_filepath} wasn't created."
+            assert functions.most_recent_audio_filepath == audio_filepath, \
+                "The variable 'most_recent_audio_filepath' wasn't set to audio_filepath."
+
+            ready_message: str = f"{global_const.AUDIO_READY_MESSAGE} {audio_filepath}"
+            assert audio_status.get() == ready_message, "The entry audio_status wasn't set to ready_message."
+
+    def test_previous_file_discarded(self, tk_root) -> None:
+        """Test whether the function discards the previous audio file
+        while the next one is being generated, so that the previous
+        one can't be played back as the audio of the new text.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+        audio_status.insert(index=0, string=f"{global_const.AUDIO_READY_MESSAGE} {TEST_PATH}")
+        functions.change_most_recent_filepath(change_to=TEST_PATH)
+
+        with patch(target="morsecode.functions.audio_executor") as mock_executor:
+            mock_executor.submit.return_value = Future()  # Never completed
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status, in_background=True)
+
+            assert functions.most_recent_audio_filepath == "", \
+                "The variable 'most_recent_audio_filepath' wasn't set to an empty string."
+            assert audio_status.get() == "", "The entry audio_status wasn't set to an empty string."
+
+    def test_discarded_outcome_not_displayed(self, tk_root) -> None:
+        """Test whether the outcome of an audio file generation
+        is discarded if the audio file is cleared while it's being
+        generated.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        audio_status: tk.Entry = tk.Entry(tk_root)
+        future: Future = Future()
+
+        with patch(target="morsecode.functions.audio_executor") as mock_executor:
+            mock_executor.submit.return_value = future
+            functions.create_audio_file(normalized_text=TEST_TEXT, audio_status=audio_status, in_background=True)
+
+        generation: int = functions.audio_file_generation
+        functions.clear_all(audio_status)
+        future.set_result(TEST_PATH)
+        functions.complete_audio_file(future=future, audio_status=audio_status, generation=generation)
+
+        assert functions.most_recent_audio_filepath == "", \
+            "The variable 'most_recent_audio_filepath' was set to the discarded audio file."
+        assert audio_status.get() == "", "The entry audio_status was set to the discarded audio file."
+
     def test_perm_err(self, tk_root) -> None:
         """Test whether the function displays an error message with
         the correct title and content in the event PermissionError
@@ -323,6 +680,195 @@ class Test_CreateAudioFile:
                 title=global_const.MESSAGEBOX_TITLE_ERROR,
                 message=global_const.MESSAGEBOX_MSG_TO_MORSE_PERM_ERROR)
 
+    def test_file_not_found_in_existing_dir(self, tk_root) -> None:
+        """Test whether the function displays an error message instead
+        of retrying endlessly in the event the audio file can't be
+        created in an existing output directory.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        error_message: str = "Error message"
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir), \
+                patch(target="builtins.open", side_effect=FileNotFoundError(error_message)), \
+                patch(target=TK_MESSAGE_ERROR) as mock_showerror:
+            functions.create_audio_file(normalized_text="Unreachable", audio_status=tk.Entry(tk_root))
+
+            mock_showerror.assert_called_once_with(title=global_const.MESSAGEBOX_TITLE_ERROR, message=error_message)
+
+    def test_unsupported_symbol_err(self, tk_root) -> None:
+        """Test whether the function displays an error message
+        in the event the audio can't be synthesized because the text
+        contains a character unsupported by the pycw module.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        error_message: str = "Unsupported symbol: '\\x01'"
+        audio_status: tk.Entry = tk.Entry(tk_root)
+
+        with patch(target="morsecode.functions.synthesize_audio", side_effect=ValueError(error_message)), \
+                patch(target=TK_MESSAGE_ERROR) as mock_showerror:
+            functions.create_audio_file(normalized_text="Unsupported", audio_status=audio_status)
+
+            mock_showerror.assert_called_once_with(title=global_const.MESSAGEBOX_TITLE_ERROR, message=error_message)
+            assert audio_status.get() == "", "The entry audio_status wasn't left empty."
+
+    @pytest.mark.parametrize("normalized_text", ["[TEST]", "{TEST}"])
+    def test_brackets_sanitized(self, tk_root, normalized_text) -> None:
+        """Test whether the function offers to remove the brackets
+        and braces, which are unsupported by the pycw module.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+            normalized_text: Text containing the unsupported characters.
+
+        Returns:
+              None
+        """
+
+        with patch(target="functions.messagebox.askyesno", return_value=False) as mock_askyesno:
+            functions.create_audio_file(normalized_text=normalized_text, audio_status=tk.Entry(tk_root))
+
+            assert mock_askyesno.called, "The confirmation prompt wasn't displayed."
+
+
+class Test_NormalizePlainText:
+    """Group of tests for the 'normalize_plain_text' function.
+
+    These tests ensure the function converts plain texts into
+    uppercase ASCII, and caches the results.
+    """
+
+    def test_diacritical_letters(self) -> None:
+        """Test whether the function replaces diacritical letters,
+        both in and outside of the Latin-1 Supplement block,
+        with their closest ASCII representations.
+
+         Returns:
+               None
+         """
+
+        assert functions.normalize_plain_text(user_plain_text=" Çàfé żółw ") == "CAFE ZOLW", \
+            "The normalized text didn't match the expected one."
+
+    def test_decomposable_letters_without_unidecode(self) -> None:
+        """Test whether the function strips the combining marks off
+        decomposable letters outside of the Latin-1 Supplement block
+        without resorting to 'unidecode'.
+
+         Returns:
+               None
+         """
+
+        functions.normalize_plain_text.cache_clear()
+
+        with patch(target="unidecode.unidecode") as mock_unidecode:
+            assert functions.normalize_plain_text(user_plain_text="Ślęża Čęstá") == "SLEZA CESTA", \
+                "The normalized text didn't match the expected one."
+            assert not mock_unidecode.called, "The text was passed to 'unidecode'."
+
+    @pytest.mark.parametrize("user_plain_text, expected_text", [("don´t", "DON'T"), ("Morse™", "MORSE(TM)"),
+                                                                ("2 ≠ 3", "2  3"), ("Why\u037e", "WHY?")])
+    def test_compatibility_characters(self, user_plain_text, expected_text) -> None:
+        """Test whether the function leaves characters other than
+        decomposable letters, such as spacing accents, symbols with
+        a compatibility or canonical decomposition, and punctuation
+        marks decomposing into others, to 'unidecode' instead of
+        decomposing them.
+
+         Args:
+             user_plain_text: Text to normalize.
+             expected_text: Expected normalized text.
+
+         Returns:
+               None
+         """
+
+        assert functions.normalize_plain_text(user_plain_text=user_plain_text) == expected_text, \
+            "The normalized text didn't match the expected one."
+
+    def test_repeated_text_cached(self) -> None:
+        """Test whether the function returns the cached normalized
+        text when normalizing the same text again.
+
+         Returns:
+               None
+         """
+
+        functions.normalize_plain_text.cache_clear()
+        functions.normalize_plain_text(user_plain_text="żółw")
+
+        with patch(target="unidecode.unidecode") as mock_unidecode:
+            assert functions.normalize_plain_text(user_plain_text="żółw") == "ZOLW", \
+                "The normalized text didn't match the first one."
+            assert not mock_unidecode.called, "The text was normalized again."
+
+
+class Test_EncodeMorseCode:
+    """Group of tests for the 'encode_morse_code' function.
+
+    These tests ensure the function encodes normalized texts
+    into Morse code, separating letters and words correctly.
+    """
+
+    def test_happy_words(self) -> None:
+        """Test whether the function separates letters with a space,
+        and words with a slash.
+
+         Returns:
+               None
+         """
+
+        assert functions.encode_morse_code(normalized_text="TEST  TEXT") == "- . ... - / - . -..- -", \
+            "The Morse code didn't match the expected one."
+
+    def test_untranslatable_chars(self) -> None:
+        """Test whether the function skips characters without
+        a Morse code equivalent.
+
+         Returns:
+               None
+         """
+
+        assert functions.encode_morse_code(normalized_text="A[B] C") == ".- -... / -.-.", \
+            "The Morse code didn't match the expected one."
+
+    def test_empty_text(self) -> None:
+        """Test whether the function returns an empty string
+        for an empty text.
+
+         Returns:
+               None
+         """
+
+        assert functions.encode_morse_code(normalized_text="") == "", "The Morse code wasn't empty."
+
+    def test_repeated_text_cached(self) -> None:
+        """Test whether the function returns the cached Morse code
+        when encoding the same text again.
+
+         Returns:
+               None
+         """
+
+        functions.encode_morse_code.cache_clear()
+        first_mcode: str = functions.encode_morse_code(normalized_text="TEST TEXT")
+        second_mcode: str = functions.encode_morse_code(normalized_text="TEST TEXT")
+
+        assert second_mcode == first_mcode, "The Morse code didn't match the first one."
+        assert functions.encode_morse_code.cache_info().hits == 1, "The Morse code wasn't cached."
+
 
 class Test_TranslateToMorseCode:
     """Group of tests for the 'translate_to_morse_code' function.
@@ -564,6 +1110,54 @@ class Test_TranslateToMorseCode:
         assert output_entry.get() == expected_morse_code, "output_entry text didn't match the expected Morse code."
         assert output_entry.cget("state") == "normal", "output_entry state didn't match the original."
 
+    def test_happy_no_audio_untranslatable_chars(self, tk_root) -> None:
+        """Test whether the function skips characters that have no
+        Morse code equivalent without leaving redundant spaces
+        between the translated letters.
+
+         Args:
+             tk_root: A top-level tkinter widget.
+
+         Returns:
+               None
+         """
+
+        expected_morse_code: str = ".- -... / -.-."  # "AB C"
+        output_entry = tk.Entry(tk_root)
+        output_entry.insert(index=0, string=TEST_TEXT)
+        output_entry.pack()
+
+        functions.translate_to_morse_code(user_plain_text="a[b] c",
+                                          audio_request=False,
+                                          audio_status=tk.Entry(tk_root),
+                                          output_entry=output_entry)
+
+        assert output_entry.get() == expected_morse_code, "output_entry text didn't match the expected Morse code."
+
+    def test_happy_no_audio_latin_1_diacritics(self, tk_root) -> None:
+        """Test whether the function translates the diacritical letters
+        of the Latin-1 Supplement block, including the ones mapped to
+        more than one ASCII letter.
+
+         Args:
+             tk_root: A top-level tkinter widget.
+
+         Returns:
+               None
+         """
+
+        expected_morse_code: str = "-.-. .- ..-. . / .-- . .. ... ..."  # "CAFE WEISS"
+        output_entry = tk.Entry(tk_root)
+        output_entry.insert(index=0, string=TEST_TEXT)
+        output_entry.pack()
+
+        functions.translate_to_morse_code(user_plain_text="Çàfé weiß",
+                                          audio_request=False,
+                                          audio_status=tk.Entry(tk_root),
+                                          output_entry=output_entry)
+
+        assert output_entry.get() == expected_morse_code, "output_entry text didn't match the expected Morse code."
+
     def test_happy_with_audio(self, tk_root) -> None:
         """Test whether the function can correctly translate a valid
         plain-text input into Morse code, and whether it can call
@@ -846,6 +1440,51 @@ class Test_TranslateToPlainText:
         assert output_entry.get() == expected_plain_text, "output_entry text didn't match expected_plain_text."
         assert output_entry.cget("state") == "normal", "output_entry state didn't match the original."
 
+    def test_happy_no_audio_extra_spaces(self, tk_root) -> None:
+        """Test whether the function translates a valid Morse code
+        input with multiple spaces between the symbols and around
+        the word separators.
+
+         Args:
+             tk_root: A top-level tkinter widget.
+
+         Returns:
+               None
+         """
+
+        expected_plain_text: str = "2 SEAS"  # "..--- / ... . .- ..."
+        output_entry = tk.Entry(tk_root)
+        output_entry.pack()
+
+        functions.translate_to_plain_text(user_morse_code_text="..---   /  ...  .   .- ...",
+                                          audio_request=False,
+                                          audio_status=tk.Entry(tk_root),
+                                          output_entry=output_entry)
+
+        assert output_entry.get() == expected_plain_text, "output_entry text didn't match expected_plain_text."
+
+    def test_happy_no_audio_consecutive_word_separators(self, tk_root) -> None:
+        """Test whether the function translates consecutive word
+        separators into a single space.
+
+         Args:
+             tk_root: A top-level tkinter widget.
+
+         Returns:
+               None
+         """
+
+        expected_plain_text: str = "A B"  # ".- / -..."
+        output_entry = tk.Entry(tk_root)
+        output_entry.pack()
+
+        functions.translate_to_plain_text(user_morse_code_text=".- / / -...",
+                                          audio_request=False,
+                                          audio_status=tk.Entry(tk_root),
+                                          output_entry=output_entry)
+
+        assert output_entry.get() == expected_plain_text, "output_entry text didn't match expected_plain_text."
+
     def test_happy_with_audio(self, tk_root) -> None:
         """Test whether the function can correctly translate a valid
         Morse code input into plain text, and whether it can call
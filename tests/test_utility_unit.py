@@ -5,10 +5,13 @@ some edge cases.
 The tested functions are:
 1. change_entry_text,
 2. change_most_recent_filepath,
-3. copy_to_clipboard,
-4. and clear_all.
+3. build_audio_filepath,
+4. find_last_audio_file_counter,
+5. copy_to_clipboard,
+6. and clear_all.
 """
 
+import tempfile
 import tkinter as tk
 from unittest.mock import patch, PropertyMock
 import pytest
@@ -187,6 +190,28 @@ class Test_ChangeEntryText:
         assert entry_readonly.get() == "New Text", "The entry's text wasn't set to the expected string."
         assert entry_readonly.cget("state") == "readonly", "The entry's state wasn't reverted to 'readonly'."
 
+    def test_change_entry_text_variable(self, tk_root) -> None:
+        """Test whether the function changes the text from
+        a "readonly" tkinter.Entry bound to a variable by setting
+        the variable, and verify the entry's state is unchanged.
+
+        Args:
+            tk_root: A top-level tkinter widget.
+
+        Returns:
+              None
+        """
+
+        entry_variable = tk.StringVar(tk_root, value=TEST_TEXT)
+        entry_readonly = tk.Entry(tk_root, textvariable=entry_variable, state="readonly")
+        entry_readonly.pack()
+
+        functions.change_entry_text(entry_to_change=entry_readonly, change_to="New Text")
+
+        assert entry_variable.get() == "New Text", "The variable wasn't set to the expected string."
+        assert entry_readonly.get() == "New Text", "The entry's text wasn't set to the expected string."
+        assert entry_readonly.cget("state") == "readonly", "The entry's state was changed."
+
 
 class Test_ChangeMostRecentFilepath:
     """Group of tests for the 'change_most_recent_filepath'
@@ -245,6 +270,79 @@ class Test_ChangeMostRecentFilepath:
                                                  " string.")
 
 
+class Test_BuildAudioFilepath:
+    """Group of tests for the 'build_audio_filepath' utility function.
+
+    These tests ensure the function builds audio filepaths
+    in the output directory, appending the counter when necessary.
+    """
+
+    def test_default_counter(self) -> None:
+        """Test whether the function returns the default audio
+        filepath in the event it's called with no arguments.
+
+        Returns:
+              None
+        """
+
+        assert functions.build_audio_filepath() == TEST_PATH, "The default audio filepath wasn't returned."
+
+    def test_non_zero_counter(self) -> None:
+        """Test whether the function appends the counter
+        to the default audio filename in the event the counter
+        isn't zero.
+
+        Returns:
+              None
+        """
+
+        assert functions.build_audio_filepath(counter=3) == "output/morse_code_audio_3.wav", \
+            "The counter wasn't appended to the audio filename."
+
+
+class Test_FindLastAudioFileCounter:
+    """Group of tests for the 'find_last_audio_file_counter' utility
+    function.
+
+    These tests ensure the function finds the highest counter among
+    the audio files in the output directory, ignoring other files.
+    """
+
+    def test_audio_files(self) -> None:
+        """Test whether the function returns the highest counter
+        among the audio files, ignoring files with other names.
+
+        Returns:
+              None
+        """
+
+        filenames: tuple = ("morse_code_audio.wav", "morse_code_audio_2.wav", "morse_code_audio_10.wav",
+                            "morse_code_audio_11.txt", "morse_code_audio_x.wav", "other_audio_12.wav")
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+            for filename in filenames:
+                open(f"{tmp_dir}/{filename}", "wb").close()
+
+            assert functions.find_last_audio_file_counter() == 10, "The highest counter wasn't returned."
+
+    def test_no_audio_files(self) -> None:
+        """Test whether the function returns -1 in the event there are
+        no audio files or the output directory doesn't exist.
+
+        Returns:
+              None
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=tmp_dir):
+                assert functions.find_last_audio_file_counter() == -1, "-1 wasn't returned for an empty directory."
+
+            with patch(target="morsecode.globals.DEFAULT_AUDIO_OUTPUT_DIR", new=f"{tmp_dir}/missing"):
+                assert functions.find_last_audio_file_counter() == -1, \
+                    "-1 wasn't returned for a missing directory."
+
+
 class Test_CopyToClipboard:
     """Group of tests for the 'copy_to_clipboard' utility function.
 